@@ -2,62 +2,49 @@
 """
 Script to find and display longest glyph names from Unicode characters.
 
-This script scans all Unicode codepoints (0x0000 to 0x10FFFF),
+This script scans all named Unicode codepoints (0x0000 to 0x10FFFF),
 generates glyph names using the context-glyphdata transformation logic,
 and displays the top 1000 longest names in descending order
 along with their lengths.
 """
 
-from context_glyphdata.core import glyph_data_for_unicode
-import youseedee
+import heapq
+
+from context_glyphdata import glyph_names_for_all, named_characters
 
 
 def main():
     print("Scanning all Unicode characters...")
     print("This may take a while...\n")
 
-    # Collect all glyph names with their lengths
-    glyph_names = []
-
-    for codepoint in range(0x0000, 0x110000):
-        try:
-            ucd = youseedee.ucd_data(codepoint)
-            if not ucd or "Name" not in ucd:
-                continue
-
-            name = ucd["Name"]
-            if not name or name.startswith("<"):
-                continue
-
-            # Generate glyph name
-            glyph_name = glyph_data_for_unicode(codepoint)
-            if glyph_name:
-                glyph_names.append((len(glyph_name), glyph_name, codepoint, name))
-        except Exception:
-            # Skip characters that cause errors
-            continue
+    # Generate all glyph names in one batch pass over the Unicode name
+    # table, and collect them with their lengths
+    unicode_names = dict(named_characters())
+    glyph_names = [
+        (len(glyph_name), glyph_name, codepoint, unicode_names[codepoint])
+        for codepoint, glyph_name in glyph_names_for_all().items()
+        if glyph_name
+    ]
 
-    # Sort by length (descending)
-    glyph_names.sort(reverse=True)
+    # Select the top 1000 by length (descending) without sorting everything
+    longest = heapq.nlargest(1000, glyph_names)
+    lengths = [length for length, *_ in glyph_names]
 
     # Print top 1000
     print("Top 1000 longest glyph names:\n")
     print(f"{'Rank':<6} {'Len':<4} " f"{'Glyph Name':<50} {'Code':<8} Unicode Name")
     print("=" * 140)
 
-    for i, (length, glyph_name, codepoint, unicode_name) in enumerate(
-        glyph_names[:1000], 1
-    ):
+    for i, (length, glyph_name, codepoint, unicode_name) in enumerate(longest, 1):
         print(
             f"{i:<6} {length:<4} {glyph_name:<50} " f"U+{codepoint:04X}  {unicode_name}"
         )
 
     print(f"\n{'=' * 140}")
     print(f"Total characters analyzed: {len(glyph_names):,}")
-    print(f"Longest name: {glyph_names[0][0]} characters")
-    print(f"Shortest name: {glyph_names[-1][0]} characters")
-    avg_length = sum(length for length, *_ in glyph_names)
-    avg_length = avg_length / len(glyph_names)
+    print(f"Longest name: {longest[0][0]} characters")
+    print(f"Shortest name: {min(lengths)} characters")
+    avg_length = sum(lengths) / len(lengths)
     print(f"Average name length: {avg_length:.1f} characters")
 
 
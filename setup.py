@@ -1,5 +1,22 @@
+import os
+
 from setuptools import setup
 
 # This file is kept for backwards compatibility
 # All configuration is in pyproject.toml
-setup()
+#
+# Optionally, the pure-Python naming pipeline in core is compiled with Cython.
+# This is opt-in: set CONTEXT_GLYPHDATA_CYTHON=1 and build with Cython
+# installed (e.g. `CONTEXT_GLYPHDATA_CYTHON=1 pip install --no-build-isolation
+# .`). Otherwise the package installs as plain Python, whatever the build
+# environment holds.
+ext_modules = []
+if os.environ.get("CONTEXT_GLYPHDATA_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["src/context_glyphdata/core.py"],
+        compiler_directives={"language_level": "3"},
+    )
+
+setup(ext_modules=ext_modules)
@@ -4,7 +4,13 @@ Context Glyph Data.
 Convert Unicode descriptions to camelCase glyph names.
 """
 
-from .core import glyph_data_for_unicode
+from .core import glyph_data_for_unicode, named_characters
+from .batch import glyph_data_for_unicodes, glyph_names_for_all
 
 __version__ = "0.1.0"
-__all__ = ["glyph_data_for_unicode"]
+__all__ = [
+    "glyph_data_for_unicode",
+    "glyph_data_for_unicodes",
+    "glyph_names_for_all",
+    "named_characters",
+]
@@ -0,0 +1,48 @@
+"""Bulk glyph name generation for many codepoints at once."""
+
+from .core import _glyph_from_name, glyph_data_for_unicode, named_characters
+
+
+def glyph_names_for_all():
+    """
+    Generate glyph names for every named Unicode character.
+
+    Walks the Unicode name table once and transforms each name directly,
+    instead of looking up every codepoint in 0x0000-0x10FFFF.
+
+    Returns:
+        dict: Mapping of codepoint (int) to glyph name (str), in codepoint
+        order.
+
+    Example:
+        >>> glyph_names_for_all()[0x0627]  # ARABIC LETTER ALEF
+        'alef-ar'
+    """
+    return {
+        codepoint: _glyph_from_name(codepoint, name)
+        for codepoint, name in named_characters()
+    }
+
+
+def glyph_data_for_unicodes(codepoints):
+    """
+    Generate glyph names for a collection of codepoints, e.g. a whole font.
+
+    Duplicates are looked up once, and results are shared with the cache of
+    glyph_data_for_unicode.
+
+    Args:
+        codepoints (iterable): Unicode codepoints as decimal integers.
+
+    Returns:
+        dict: Mapping of codepoint (int) to glyph name (str), in codepoint
+        order.
+
+    Example:
+        >>> glyph_data_for_unicodes([0x0628, 0x0627, 0x0627])
+        {1575: 'alef-ar', 1576: 'beh-ar'}
+    """
+    return {
+        codepoint: glyph_data_for_unicode(codepoint)
+        for codepoint in sorted(set(codepoints))
+    }
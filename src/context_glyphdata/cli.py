@@ -2,8 +2,10 @@
 
 import sys
 import argparse
-import youseedee
-from .core import glyph_data_for_unicode
+from .core import _glyph_from_name, glyph_data_for_unicode, named_characters
+
+# Number of named characters 'render' writes to stdout at a time
+RENDER_CHUNK_SIZE = 1024
 
 
 def char_command(character):
@@ -12,6 +14,8 @@ def char_command(character):
         print("Error: Please provide exactly one character", file=sys.stderr)
         sys.exit(1)
 
+    import youseedee
+
     char = character
     codepoint = ord(char)
 
@@ -39,26 +43,20 @@ def char_command(character):
 
 def render_command():
     """Render all Unicode characters with their names and glyph names."""
-    # Scan entire Unicode range
-    for codepoint in range(0x0000, 0x110000):
-        try:
-            ucd = youseedee.ucd_data(codepoint)
-            if not ucd or "Name" not in ucd:
-                continue
-
-            name = ucd["Name"]
-            if not name or name.startswith("<"):
-                continue
-
-            # Generate glyph name
-            glyph_name = glyph_data_for_unicode(codepoint)
-
-            # Print in format: U+XXXX UNICODE_NAME -> glyph_name
-            print(f"U+{codepoint:04X} {name:60} -> {glyph_name}")
-
-        except Exception:
-            # Skip characters that cause errors
-            continue
+    # Only visit assigned, named codepoints, in codepoint order
+    characters = named_characters()
+    for start in range(0, len(characters), RENDER_CHUNK_SIZE):
+        lines = []
+        for codepoint, name in characters[start : start + RENDER_CHUNK_SIZE]:
+            # Generate glyph name (the name is known, so skip the UCD lookup)
+            glyph_name = _glyph_from_name(codepoint, name)
+
+            # Format: U+XXXX UNICODE_NAME -> glyph_name
+            lines.append(f"U+{codepoint:04X} {name:60} -> {glyph_name}\n")
+
+        # Write each chunk (~100 KB) at once rather than line by line, so
+        # piping into grep doesn't cost one write per character
+        sys.stdout.write("".join(lines))
 
 
 def main():
@@ -1,7 +1,11 @@
 """Core functionality for generating glyph names from Unicode data."""
 
+import functools
+import json
+import os
 import re
-import youseedee
+import tempfile
+from pathlib import Path
 
 
 # Mapping of script names to their short suffixes
@@ -166,40 +170,347 @@ SCRIPT_SUFFIXES = {
     "OLD": "-old",  # Covers Old Italic, Old Persian, etc.
 }
 
-# Categories and descriptive words to drop from the name
-DROP_CATEGORIES = {
-    # General categories
-    "LETTER",
-    "MARK",
-    "NUMBER",
-    "PUNCTUATION",
-    "SYMBOL",
-    "SEPARATOR",
-    "DIGIT",
-    "SIGN",
-    "LIGATURE",
-    "SYLLABLE",
-    "RADICAL",
-    "IDEOGRAPH",
-    "CHARACTER",
-    "ACCENT",
-    "INDIC",  # Arabic-Indic digits
-    # Script-specific descriptive words
-    "SUNG",  # Lao: tone marking variations (keep TAM, drop SUNG)
-    # Runic descriptive names - keep shortest form
+# Single-word scripts are looked up directly by the first word of a name
+_SINGLE_WORD_SCRIPTS = {
+    script: suffix for script, suffix in SCRIPT_SUFFIXES.items() if " " not in script
 }
 
+# The few multi-word scripts are pre-split into words and grouped by their
+# first word, so most names need a single failed lookup to rule them out.
+# Within a group they are sorted by word count (descending), and they are
+# matched before single-word ones
+_MULTI_WORD_SCRIPTS = {}
+for _words, _suffix in sorted(
+    (
+        (script.split(), suffix)
+        for script, suffix in SCRIPT_SUFFIXES.items()
+        if " " in script
+    ),
+    key=lambda x: len(x[0]),
+    reverse=True,
+):
+    _MULTI_WORD_SCRIPTS.setdefault(_words[0], []).append((_words, _suffix))
+del _words, _suffix
+
+# Categories and descriptive words to drop from the name
+DROP_CATEGORIES = frozenset(
+    {
+        # General categories
+        "LETTER",
+        "MARK",
+        "NUMBER",
+        "PUNCTUATION",
+        "SYMBOL",
+        "SEPARATOR",
+        "DIGIT",
+        "SIGN",
+        "LIGATURE",
+        "SYLLABLE",
+        "RADICAL",
+        "IDEOGRAPH",
+        "CHARACTER",
+        "ACCENT",
+        "INDIC",  # Arabic-Indic digits
+        # Script-specific descriptive words
+        "SUNG",  # Lao: tone marking variations (keep TAM, drop SUNG)
+        # Runic descriptive names - keep shortest form
+    }
+)
+
 # Case indicator words to drop (we'll use actual casing instead)
-CASE_INDICATORS = {
-    "CAPITAL",
-    "SMALL",
+CASE_INDICATORS = frozenset(
+    {
+        "CAPITAL",
+        "SMALL",
+    }
+)
+
+# Case indicators to drop when SMALL must be kept (small variants, and
+# Hiragana/Katakana where SMALL is part of the letter identity)
+_CAPITAL_INDICATOR = frozenset({"CAPITAL"})
+
+# Scripts that have both NUMBER and DIGIT characters (need disambiguation)
+_SCRIPTS_WITH_NUMBER_AND_DIGIT = frozenset(
+    {
+        "-brah",  # Brahmi
+        "-cop",  # Coptic
+        "-khar",  # Kharoshthi
+        "-sinh",  # Sinhala
+        "-ahom",  # Ahom
+        "-wara",  # Warang Citi
+        "-bhai",  # Bhaiksuki
+    }
+)
+
+# Scripts with case: Latin, Greek, Cyrillic, Georgian, Cherokee,
+# Limbu, Phags-pa, Chorasmian
+_SCRIPTS_WITH_CASE = frozenset(
+    {
+        "-lat",
+        "-gr",
+        "-cyr",
+        "-geo",
+        "-glag",
+        "-cop",
+        "-arm",
+        "-chr",
+        "-limb",
+        "-phag",
+        "-chrs",
+    }
+)
+
+# Scripts that have CAPITAL variants (need Caseless suffix)
+_SCRIPTS_WITH_CAPITALS = frozenset(
+    {
+        "-lat",
+        "-gr",
+        "-cyr",
+        "-geo",
+        "-glag",
+        "-cop",
+        "-arm",
+    }
+)
+
+# Scripts where SIGN is kept to disambiguate (TAI YO: LETTER vs SIGN)
+_SCRIPTS_WITH_SIGN = frozenset({"-tai"})
+
+# Scripts where SMALL is a size variant, not case
+_KANA_SCRIPTS = frozenset({"-hira", "-kata"})
+
+# Hangul position words (initial/medial/final)
+_HANGUL_POSITIONS = frozenset({"CHOSEONG", "JUNGSEONG", "JONGSEONG"})
+
+# Connecting words to drop, keyed by (is_symbol_for, has_syllable):
+# FOR is kept in "SYMBOL FOR ..." names, and TO/THE are kept for syllables
+# because they're the syllable value
+_CONNECTING_WORDS = {
+    (False, False): frozenset({"WITH", "OF", "FOR", "TO", "THE"}),
+    (False, True): frozenset({"WITH", "OF", "FOR"}),
+    (True, False): frozenset({"WITH", "OF", "TO", "THE"}),
+    (True, True): frozenset({"WITH", "OF"}),
+}
+
+# ASCII letters and digits have fixed Unicode names (character names never
+# change), so their glyph names are derived directly without a UCD lookup
+# "LATIN CAPITAL LETTER A" -> "A-lat", "DIGIT ZERO" -> "zero"
+_ASCII_FASTPATH = {
+    codepoint: chr(codepoint) + "-lat"
+    for codepoint in (*range(0x41, 0x5B), *range(0x61, 0x7B))
+}
+_ASCII_FASTPATH.update(
+    zip(range(0x30, 0x3A), "zero one two three four five six seven eight nine".split())
+)
+
+# Character families named by a fixed prefix plus a code, such as
+# "NUSHU CHARACTER-1B170" or "TANGUT COMPONENT-001". When the code starts with
+# a digit, the pipeline turns them into a fixed glyph name prefix followed by
+# the lowercased code, so those are built directly:
+# name prefix -> (glyph name prefix, script suffix)
+_CODED_NAME_PREFIXES = {
+    "CJK COMPATIBILITY IDEOGRAPH": ("cjkCompatibilityIdeograph", ""),
+    "EGYPTIAN HIEROGLYPH": ("hieroglyph", "-egy"),
+    "KHITAN SMALL SCRIPT CHARACTER": ("khitanSmallScript", ""),
+    "NUSHU CHARACTER": ("nushu", ""),
+    "TANGUT COMPONENT": ("component", "-tang"),
 }
 
 
+class _CasedWords(dict):
+    """Word -> cased word cache that fills itself on first lookup."""
+
+    def __init__(self, transform):
+        super().__init__()
+        self._transform = transform
+
+    def __missing__(self, word):
+        cased = self[word] = self._transform(word)
+        return cased
+
+
+# Unicode names are built from a limited vocabulary of words (~27k distinct
+# across all names, ~5k of them as first words), so the cased forms of each
+# word are computed once and shared between calls. The vocabulary is bounded
+# by the UCD, so the caches need no eviction, and a hit is a plain dict
+# lookup with no Python-level call.
+_cap = _CasedWords(str.capitalize).__getitem__
+_low = _CasedWords(str.lower).__getitem__
+
+
+def _fallback_name(decimal_unicode):
+    """Return the "uniXXXX" name used for codepoints without a usable name."""
+    # printf-style formatting skips the format-spec parsing of f"{x:04X}"
+    return "uni%04X" % decimal_unicode
+
+
+# Runic words that describe a letter's shape rather than transcribe it
+_RUNIC_DESCRIPTORS = frozenset({"DOTTED", "LONG", "BRANCH", "SHORT", "GOLDEN"})
+
+
+def _runic_parts(parts):
+    """Split Runic compounds and drop single-letter transcription variants."""
+    # Split hyphenated parts like "LONG-BRANCH-OSS" or "DOTTED-N"
+    if any("-" in part for part in parts):
+        parts = [
+            piece
+            for part in parts
+            for piece in (part.split("-") if "-" in part else (part,))
+        ]
+
+    # For runic letters, filter single-letter transcription variants
+    # "FEHU FEOH FE F" -> keep "FEHU", "FEOH", "FE", drop "F"
+    # "OS O" -> keep "OS", drop "O"
+    # "DOTTED-N" -> keep "DOTTED", "N" (both meaningful, not variants)
+    # "V" -> keep "V" (only one part)
+
+    # If we have 2+ parts and at least one is single-letter, check if the
+    # multi-letter ones look like transcription variants
+    if len(parts) >= 2 and any(len(p) == 1 for p in parts):
+        multi_letter_parts = [p for p in parts if len(p) > 1]
+
+        # If ANY multi-letter part looks like a transcription
+        # (not a descriptor like DOTTED, LONG, BRANCH)
+        # then drop single letters
+        if any(p not in _RUNIC_DESCRIPTORS for p in multi_letter_parts):
+            # We have transcription variants, keep multi-letter only
+            parts = multi_letter_parts
+    # Otherwise keep all parts
+    return parts, ""
+
+
+def _hebrew_parts(parts):
+    """Move a Hebrew ACCENT/PUNCTUATION word into the glyph name suffix."""
+    # "HEBREW ACCENT GERESH" -> "gereshAccent-heb"
+    # "HEBREW PUNCTUATION GERESH" -> "gereshPunctuation-heb"
+    # Hebrew names carry these words at most once, so drop them in place
+    if "ACCENT" in parts:
+        parts.remove("ACCENT")
+        return parts, "Accent"
+    if "PUNCTUATION" in parts:
+        parts.remove("PUNCTUATION")
+        return parts, "Punctuation"
+    return parts, ""
+
+
+# Script-specific token handling, applied AFTER filtering. Each handler takes
+# the remaining parts and returns (parts, suffix), where suffix is appended
+# just before the script suffix. Scripts without a handler skip this step.
+_SCRIPT_HANDLERS = {
+    "-run": _runic_parts,
+    "-heb": _hebrew_parts,
+}
+
+
+# Name table derived from UnicodeData.txt, kept in this package's own cache
+# directory
+_NAMES_CACHE_FILE = "unicode-names.json"
+
+
+def _cache_dir():
+    """Return the directory where derived Unicode data is cached."""
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("context-glyphdata"))
+
+
+@functools.lru_cache(maxsize=None)
+def _unicode_names():
+    """
+    Map every codepoint listed in UnicodeData.txt to its name field.
+
+    This is the only part of the UCD the glyph names depend on. The table is
+    cached on disk and rebuilt whenever youseedee's UnicodeData.txt changes,
+    so later processes skip parsing the UCD altogether.
+
+    Returns:
+        dict: Mapping of codepoint (int) to name (str), range markers such
+        as "<CJK Ideograph, First>" included.
+    """
+    # (imported here: loading youseedee pulls in requests and friends, which
+    # would otherwise slow down every import of this package)
+    import youseedee
+
+    # Let youseedee download or refresh its UCD before the cache is trusted;
+    # a refreshed UnicodeData.txt no longer matches the cache key below
+    youseedee.ensure_files()
+
+    source = youseedee.ucd_dir() / "UnicodeData.txt"
+    cache = _cache_dir() / _NAMES_CACHE_FILE
+    try:
+        stat = source.stat()
+        with open(cache, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["source"] == [stat.st_mtime_ns, stat.st_size]:
+            return {codepoint: name for codepoint, name in cached["names"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, stale or unreadable cache: rebuild it below
+        pass
+
+    table = youseedee.parsed_unicode_file("UnicodeData.txt")
+    # The first column of each UnicodeData row is the character name
+    names = {codepoint: row[0] for codepoint, row in table.items()}
+
+    # Write to a uniquely named temporary file first, so that concurrent
+    # writers never read a half-written cache or clobber each other's file
+    temporary = None
+    try:
+        stat = source.stat()
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache.parent, suffix=".tmp", delete=False
+        ) as f:
+            temporary = f.name
+            json.dump(
+                {
+                    "source": [stat.st_mtime_ns, stat.st_size],
+                    "names": sorted(names.items()),
+                },
+                f,
+            )
+        os.replace(temporary, cache)
+    except OSError:
+        # Read-only cache directory: keep the table in memory only
+        pass
+    finally:
+        # Don't leave the temporary file behind if writing or renaming failed
+        if temporary is not None and os.path.exists(temporary):
+            os.remove(temporary)
+    return names
+
+
+def named_characters():
+    """
+    List all codepoints that have a Unicode character name.
+
+    Reads the UnicodeData name table once instead of querying every
+    codepoint in 0x0000-0x10FFFF, most of which are unassigned. Range
+    markers such as "<CJK Ideograph, First>" are skipped.
+
+    Returns:
+        list: (codepoint, name) tuples in codepoint order.
+
+    Example:
+        >>> named_characters()[0]
+        (32, 'SPACE')
+    """
+    return sorted(
+        (codepoint, name)
+        for codepoint, name in _unicode_names().items()
+        if name and not name.startswith("<")
+    )
+
+
+@functools.lru_cache(maxsize=200_000)
 def glyph_data_for_unicode(decimal_unicode):
     """
     Generate a short camelCase glyph name from a Unicode codepoint.
 
+    Results are memoized per codepoint, since the name only depends on the
+    Unicode data. The cache holds more entries than there are assigned
+    characters outside the private use areas. Use
+    ``glyph_data_for_unicode.cache_clear()`` to reset.
+
     Args:
         decimal_unicode (int): The Unicode codepoint as a decimal integer.
 
@@ -210,14 +521,44 @@ def glyph_data_for_unicode(decimal_unicode):
         >>> glyph_data_for_unicode(0x0627)  # ARABIC LETTER ALEF
         'alef-ar'
     """
-    # Get Unicode character data
-    ucd = youseedee.ucd_data(decimal_unicode)
+    # ASCII letters and digits don't need the full pipeline
+    glyph_name = _ASCII_FASTPATH.get(decimal_unicode)
+    if glyph_name is not None:
+        return glyph_name
+
+    # Get the Unicode character name (the only UCD field the name needs)
+    name = _unicode_names().get(decimal_unicode)
 
-    if not ucd or "Name" not in ucd:
+    if name is None:
         # Fallback for characters without names
-        return f"uni{decimal_unicode:04X}"
+        return _fallback_name(decimal_unicode)
+
+    return _glyph_from_name(decimal_unicode, name)
+
+
+def _glyph_from_name(decimal_unicode, name):
+    """
+    Transform a Unicode character name into a glyph name.
+
+    This is the naming pipeline behind glyph_data_for_unicode, for callers
+    that already have the character name and can skip the UCD lookup.
+
+    Args:
+        decimal_unicode (int): The Unicode codepoint as a decimal integer.
+        name (str): The Unicode character name of that codepoint.
 
-    name = ucd["Name"]
+    Returns:
+        str: A short camelCase glyph name.
+    """
+    # Coded character families don't need the full pipeline when the code
+    # starts with a digit, e.g. "nushu1b170" (the pipeline keeps a hyphen
+    # before a letter, so those names take the long way)
+    prefix, hyphen, code = name.rpartition("-")
+    if hyphen and code[:1].isdigit() and code.isalnum():
+        coded = _CODED_NAME_PREFIXES.get(prefix)
+        if coded is not None:
+            glyph_prefix, suffix = coded
+            return glyph_prefix + code.lower() + suffix
 
     # Apply replacements to shorten long names before tokenization
     # These replacements reduce the length of the longest glyph names
@@ -232,71 +573,79 @@ def glyph_data_for_unicode(decimal_unicode):
     name = name.replace("MATHEMATICAL", "MATH")
 
     # Arabic special cases
-    name = name.replace("FATHATAN", "FATHA TANWEEN")
-    name = name.replace("DAMMATAN", "DAMMA TANWEEN")
-    name = name.replace("KASRATAN", "KASRA TANWEEN")
-
-    # Remove hyphens in specific phrases:
-    # If all hyphens are removed by replacement,
-    # it will lead to duplicate names that I
-    # was unable to resolve, hence targeted replacements only
-    name = name.replace("SANS-SERIF", "SANS SERIF")
-    name = name.replace("-HEADED", " HEADED")
-    name = name.replace("ARABIC-INDIC", "ARABIC INDIC")
-    name = name.replace("-VAS", " VAS")
-    name = name.replace("-VAS", " VAS")
-    name = name.replace("AS-SALAATU", "AS SALAATU")
-    name = name.replace("WAS-SALAAM", "WAS SALAAM")
-    name = name.replace("AR-RAHMAN", "AR RAHMAN")
-    name = name.replace("AR-RAHMAH", "AR RAHMAH")
-    name = name.replace("AR-RAHEEM", "AR RAHEEM")
-    name = name.replace("AS-SALAAM", "AS SALAAM")
-    name = name.replace("DOUBLE-STRUCK", "DOUBLE STRUCK")
-    name = name.replace("EXTRA-", "EXTRA ")
-    name = name.replace("LEFT-TO-RIGHT", "LEFT TO RIGHT")
-    name = name.replace("RIGHT-TO-LEFT", "RIGHT TO LEFT")
-    name = name.replace("PHASE-A", "PHASE A")
-    name = name.replace("PHASE-B", "PHASE B")
-    name = name.replace("PHASE-C", "PHASE C")
-    name = name.replace("PHASE-D", "PHASE D")
-    name = name.replace("PHASE-E", "PHASE E")
-    name = name.replace("PHASE-F", "PHASE F")
-    name = name.replace("NIEUN-", "NIEUN ")
-    name = name.replace("ARAEA-", "ARAEA ")
-    name = name.replace("TIKEUT-", "TIKEUT ")
-    name = name.replace("TH-CREE", "TH CREE")
-    name = name.replace("VERTICAL-LINE-", "VERTICAL LINE ")
-    name = name.replace("WEST-CREE", "WEST CREE")
-    name = name.replace("WOODS-CREE", "WOODS CREE")
-    name = name.replace("LESS-THAN", "LESS THAN")
-    name = name.replace("GREATER-THAN", "GREATER THAN")
-    name = name.replace("OPEN-", "OPEN ")
-    name = name.replace("HAND-", "HAND ")
-    name = name.replace("-HAND", " HAND")
-    name = name.replace("-LIKE", " LIKE")
-    name = name.replace("-LIGHTED", " LIGHTED")
-    name = name.replace("THREE-D", "3D")
-    name = name.replace("-SHAPED", " SHAPED")
-    name = name.replace("MOVEMENT-", "MOVEMENT ")
-
-    # Remove hyphens before numbers (e.g., "TONE-1" -> "TONE 1")
-    name = re.sub(r"-(\d)", r" \1", name)
-
-    # Replace hyphens in some scripts
-    if (
-        "HANGUL" in name
-        or "CANADIAN" in name
-        or "SINHALA" in name
-        or "KHMER" in name
-        or "HENTAIGANA" in name
-    ):
-        name = name.replace("-", " ")
+    # (all three contain "ATAN", so most names need only one scan)
+    if "ATAN" in name:
+        name = name.replace("FATHATAN", "FATHA TANWEEN")
+        name = name.replace("DAMMATAN", "DAMMA TANWEEN")
+        name = name.replace("KASRATAN", "KASRA TANWEEN")
+
+    # Every replacement below only touches hyphens, and most names have
+    # none, so a single scan lets them skip the whole chain
+    if "-" in name:
+        # Remove hyphens in specific phrases:
+        # If all hyphens are removed by replacement,
+        # it will lead to duplicate names that I
+        # was unable to resolve, hence targeted replacements only
+        name = name.replace("SANS-SERIF", "SANS SERIF")
+        name = name.replace("-HEADED", " HEADED")
+        name = name.replace("ARABIC-INDIC", "ARABIC INDIC")
+        name = name.replace("-VAS", " VAS")
+        name = name.replace("-VAS", " VAS")
+        name = name.replace("AS-SALAATU", "AS SALAATU")
+        name = name.replace("WAS-SALAAM", "WAS SALAAM")
+        name = name.replace("AR-RAHMAN", "AR RAHMAN")
+        name = name.replace("AR-RAHMAH", "AR RAHMAH")
+        name = name.replace("AR-RAHEEM", "AR RAHEEM")
+        name = name.replace("AS-SALAAM", "AS SALAAM")
+        name = name.replace("DOUBLE-STRUCK", "DOUBLE STRUCK")
+        name = name.replace("EXTRA-", "EXTRA ")
+        name = name.replace("LEFT-TO-RIGHT", "LEFT TO RIGHT")
+        name = name.replace("RIGHT-TO-LEFT", "RIGHT TO LEFT")
+        name = name.replace("PHASE-A", "PHASE A")
+        name = name.replace("PHASE-B", "PHASE B")
+        name = name.replace("PHASE-C", "PHASE C")
+        name = name.replace("PHASE-D", "PHASE D")
+        name = name.replace("PHASE-E", "PHASE E")
+        name = name.replace("PHASE-F", "PHASE F")
+        name = name.replace("NIEUN-", "NIEUN ")
+        name = name.replace("ARAEA-", "ARAEA ")
+        name = name.replace("TIKEUT-", "TIKEUT ")
+        name = name.replace("TH-CREE", "TH CREE")
+        name = name.replace("VERTICAL-LINE-", "VERTICAL LINE ")
+        name = name.replace("WEST-CREE", "WEST CREE")
+        name = name.replace("WOODS-CREE", "WOODS CREE")
+        name = name.replace("LESS-THAN", "LESS THAN")
+        name = name.replace("GREATER-THAN", "GREATER THAN")
+        name = name.replace("OPEN-", "OPEN ")
+        name = name.replace("HAND-", "HAND ")
+        name = name.replace("-HAND", " HAND")
+        name = name.replace("-LIKE", " LIKE")
+        name = name.replace("-LIGHTED", " LIGHTED")
+        name = name.replace("THREE-D", "3D")
+        name = name.replace("-SHAPED", " SHAPED")
+        name = name.replace("MOVEMENT-", "MOVEMENT ")
+
+        # Remove hyphens before numbers (e.g., "TONE-1" -> "TONE 1")
+        name = re.sub(r"-(\d)", r" \1", name)
+
+        # Replace hyphens in some scripts
+        if (
+            "HANGUL" in name
+            or "CANADIAN" in name
+            or "SINHALA" in name
+            or "KHMER" in name
+            or "HENTAIGANA" in name
+        ):
+            name = name.replace("-", " ")
 
     # Start processing the name
     parts = name.split()
+    # Set of the original words, so word checks are O(1) and still see words
+    # that get filtered out of parts
+    name_words = frozenset(parts)
 
     # Check if this is a capital letter (before removing case indicators)
-    is_capital = "CAPITAL" in parts
+    is_capital = "CAPITAL" in name_words
 
     # Detect script suffix (check multi-word scripts first, then single-word)
     # IMPORTANT: Only match scripts at the BEGINNING of the name to avoid
@@ -304,62 +653,45 @@ def glyph_data_for_unicode(decimal_unicode):
     script_suffix = ""
     script_words_to_remove = []
 
-    # Sort scripts by word count (descending) to match multi-word scripts first
-    sorted_scripts = sorted(
-        SCRIPT_SUFFIXES.items(), key=lambda x: len(x[0].split()), reverse=True
-    )
-
-    for script, suffix in sorted_scripts:
-        script_parts = script.split()
+    first_word = parts[0] if parts else ""
+    for script_parts, suffix in _MULTI_WORD_SCRIPTS.get(first_word, ()):
         # Check if the script name appears at the START of parts
-        if len(script_parts) <= len(parts):
-            if parts[: len(script_parts)] == script_parts:
-                script_suffix = suffix
-                script_words_to_remove = script_parts
-                break
-
-    # Remove script name words from parts
-    if script_words_to_remove:
-        # Remove all occurrences of script words
-        for word in script_words_to_remove:
-            parts = [p for p in parts if p != word]
+        if parts[: len(script_parts)] == script_parts:
+            script_suffix = suffix
+            script_words_to_remove = script_parts
+            break
+    else:
+        # Single-word scripts need only one lookup of the first word
+        suffix = _SINGLE_WORD_SCRIPTS.get(first_word)
+        if suffix is not None:
+            script_suffix = suffix
+            script_words_to_remove = parts[:1]
 
     # Track special variants before removing descriptors
     # These help disambiguate otherwise identical names
-    is_small_variant = "SMALL" in parts and not script_suffix
-    is_symbol_for = "SYMBOL" in parts and "FOR" in parts
-    is_punctuation_variant = "PUNCTUATION" in parts and not script_suffix
-    is_small_capital = "SMALL" in parts and "CAPITAL" in parts
-    is_symbol_variant = "SYMBOL" in parts and script_suffix  # Greek symbols
-    is_accent_variant = "ACCENT" in parts and script_suffix  # Hebrew accents
-    is_punctuation_script_variant = "PUNCTUATION" in parts and script_suffix
+    is_small_variant = "SMALL" in name_words and not script_suffix
+    is_symbol_for = "SYMBOL" in name_words and "FOR" in name_words
+    is_punctuation_variant = "PUNCTUATION" in name_words and not script_suffix
+    is_small_capital = "SMALL" in name_words and "CAPITAL" in name_words
+    is_symbol_variant = "SYMBOL" in name_words and script_suffix  # Greek symbols
+    is_accent_variant = "ACCENT" in name_words and script_suffix  # Hebrew accents
+    is_punctuation_script_variant = "PUNCTUATION" in name_words and script_suffix
     # SMALL is only a variant for scripts when LETTER/LIGATURE is NOT present
     # (e.g., "ARABIC SMALL FATHA" vs "ARABIC FATHA")
     # but NOT for "LATIN SMALL LETTER A" or "LATIN SMALL LIGATURE OE"
     is_small_script_variant = (
-        "SMALL" in parts
+        "SMALL" in name_words
         and script_suffix
-        and "CAPITAL" not in parts
-        and "LETTER" not in parts
-        and "LIGATURE" not in parts
+        and "CAPITAL" not in name_words
+        and "LETTER" not in name_words
+        and "LIGATURE" not in name_words
     )
     # Keep category words that disambiguate
-    has_radical = "RADICAL" in parts
-    has_number = "NUMBER" in parts
-    has_digit = "DIGIT" in parts
-    has_ideograph = "IDEOGRAPH" in parts
-    has_syllable = "SYLLABLE" in parts or "SYLLABICS" in parts
-
-    # Scripts that have both NUMBER and DIGIT characters (need disambiguation)
-    scripts_with_number_and_digit = {
-        "-brah",  # Brahmi
-        "-cop",  # Coptic
-        "-khar",  # Kharoshthi
-        "-sinh",  # Sinhala
-        "-ahom",  # Ahom
-        "-wara",  # Warang Citi
-        "-bhai",  # Bhaiksuki
-    }
+    has_radical = "RADICAL" in name_words
+    has_number = "NUMBER" in name_words
+    has_digit = "DIGIT" in name_words
+    has_ideograph = "IDEOGRAPH" in name_words
+    has_syllable = "SYLLABLE" in name_words or "SYLLABICS" in name_words
 
     # Remove category words (but keep some for disambiguation)
     parts_to_keep = set()
@@ -368,7 +700,7 @@ def glyph_data_for_unicode(decimal_unicode):
     if is_symbol_for or is_symbol_variant:
         parts_to_keep.add("SYMBOL")
     # For non-script symbols, keep SYMBOL if it helps disambiguate
-    if not script_suffix and "SYMBOL" in parts:
+    if not script_suffix and "SYMBOL" in name_words:
         parts_to_keep.add("SYMBOL")
     if is_punctuation_variant or is_punctuation_script_variant:
         parts_to_keep.add("PUNCTUATION")
@@ -381,7 +713,7 @@ def glyph_data_for_unicode(decimal_unicode):
         parts_to_keep.add("NUMBER")
     # Only keep DIGIT for scripts that have both NUMBER and DIGIT
     # (to avoid conflicts like BRAHMI NUMBER ONE vs BRAHMI DIGIT ONE)
-    if has_digit and script_suffix in scripts_with_number_and_digit:
+    if has_digit and script_suffix in _SCRIPTS_WITH_NUMBER_AND_DIGIT:
         parts_to_keep.add("DIGIT")
     if has_ideograph:
         parts_to_keep.add("IDEOGRAPH")
@@ -389,80 +721,54 @@ def glyph_data_for_unicode(decimal_unicode):
     # Note: LETTER for caseless variants treated as uppercase
     # But add "Caseless" suffix when needed to disambiguate
     # Keep MARK, LETTER, SIGN when they disambiguate
-    if "MARK" in parts and "LETTER" not in parts:
+    if "MARK" in name_words and "LETTER" not in name_words:
         parts_to_keep.add("MARK")
 
     # Track if this is a caseless letter (should be treated as uppercase)
     is_caseless_letter = False
     caseless_suffix = ""
     if script_suffix:  # For script characters
-        if "VOWEL" in parts:
+        if "VOWEL" in name_words:
             parts_to_keep.add("SIGN")  # VOWEL vs VOWEL SIGN
         # Treat caseless letters as uppercase in scripts with case
         # e.g., "LATIN LETTER GLOTTAL STOP" -> "GlottalStopCaseless-lat"
         # Only add "Caseless" suffix for scripts with CAPITAL variants
-        # Scripts with case: Latin, Greek, Cyrillic, Georgian, Cherokee,
-        # Limbu, Phags-pa, Chorasmian
-        scripts_with_case = {
-            "-lat",
-            "-gr",
-            "-cyr",
-            "-geo",
-            "-glag",
-            "-cop",
-            "-arm",
-            "-chr",
-            "-limb",
-            "-phag",
-            "-chrs",
-        }
-        # Scripts that have CAPITAL variants (need Caseless suffix)
-        scripts_with_capitals = {
-            "-lat",
-            "-gr",
-            "-cyr",
-            "-geo",
-            "-glag",
-            "-cop",
-            "-arm",
-        }
-        has_case_indicator = "SMALL" in parts or "CAPITAL" in parts
+        has_case_indicator = "SMALL" in name_words or "CAPITAL" in name_words
 
         # For Hiragana/Katakana, SMALL is part of letter name, not case
         # So treat as if it has case indicator (to avoid treating as caseless)
-        if script_suffix in {"-hira", "-kata"}:
+        if script_suffix in _KANA_SCRIPTS:
             has_case_indicator = True
 
         if (
-            "LETTER" in parts
+            "LETTER" in name_words
             and not has_case_indicator
-            and script_suffix in scripts_with_case
+            and script_suffix in _SCRIPTS_WITH_CASE
         ):
             is_caseless_letter = True
             # Add "Caseless" suffix only for scripts with CAPITAL variants
-            if script_suffix in scripts_with_capitals:
+            if script_suffix in _SCRIPTS_WITH_CAPITALS:
                 caseless_suffix = "Caseless"
         # Keep SIGN for specific scripts
-        scripts_with_sign = {"-tai"}  # TAI YO: LETTER vs SIGN
-        if "SIGN" in parts and script_suffix in scripts_with_sign:
+        if "SIGN" in name_words and script_suffix in _SCRIPTS_WITH_SIGN:
             parts_to_keep.add("SIGN")
-        if "MARK" in parts and ("LETTER" in name or "SIGN" in name):
+        if "MARK" in name_words and ("LETTER" in name_words or "SIGN" in name_words):
             # e.g., SAMARITAN MARK IN vs SAMARITAN LETTER IN
             parts_to_keep.add("MARK")
             # Also treat as caseless letter for marks
             if (
-                "LETTER" in parts
+                "LETTER" in name_words
                 and not has_case_indicator
-                and script_suffix in scripts_with_case
+                and script_suffix in _SCRIPTS_WITH_CASE
             ):
                 is_caseless_letter = True
                 # Add "Caseless" suffix only for scripts with CAPITAL variants
-                if script_suffix in scripts_with_capitals:
+                if script_suffix in _SCRIPTS_WITH_CAPITALS:
                     caseless_suffix = "Caseless"
     else:
         # For non-script items, keep SIGN to disambiguate
         # e.g., "COLON" vs "COLON SIGN"
-        if "SIGN" in parts:
+        if "SIGN" in name_words:
             parts_to_keep.add("SIGN")
 
     # Special handling for syllable tokens - extract before filtering
@@ -470,101 +776,71 @@ def glyph_data_for_unicode(decimal_unicode):
     # "ETHIOPIC SYLLABLE HA" -> "haSyllable-eth"
     # "CANADIAN SYLLABICS A" -> "aSyllabics-can"
     syllable_suffix = ""
-    if "SYLLABLE" in parts:
+    extra_words_to_remove = set(script_words_to_remove)
+    if "SYLLABLE" in name_words:
         syllable_suffix = "Syllable"
         # SYLLABLE will be removed by DROP_CATEGORIES
-    elif "SYLLABICS" in parts:
+    elif "SYLLABICS" in name_words:
         syllable_suffix = "Syllabics"
         # Remove SYLLABICS from parts (not in DROP_CATEGORIES)
-        parts = [p for p in parts if p != "SYLLABICS"]
-
-    parts = [p for p in parts if p not in DROP_CATEGORIES or p in parts_to_keep]
+        extra_words_to_remove.add("SYLLABICS")
 
     # Special handling for Hangul position indicators
     # Keep track if it's initial/medial/final before removing
     hangul_position = ""
     if script_suffix == "-ko":
-        if "CHOSEONG" in name:
+        if "CHOSEONG" in name_words:
             hangul_position = "Cho"  # Initial
-        elif "JUNGSEONG" in name:
+        elif "JUNGSEONG" in name_words:
             hangul_position = "Jung"  # Medial
-        elif "JONGSEONG" in name:
+        elif "JONGSEONG" in name_words:
             hangul_position = "Jong"  # Final
         # Remove the position words after saving them
-        parts = [p for p in parts if p not in {"CHOSEONG", "JUNGSEONG", "JONGSEONG"}]
+        extra_words_to_remove |= _HANGUL_POSITIONS
 
     # Remove case indicator words (but keep SMALL/CAPITAL for variant detection)
-    case_indicators_to_remove = CASE_INDICATORS.copy()
-    if is_small_variant or is_small_capital or is_small_script_variant:
-        case_indicators_to_remove.discard("SMALL")
-    # For small capitals, keep both SMALL and CAPITAL for disambiguation
     if is_small_capital:
-        case_indicators_to_remove.discard("CAPITAL")
-    # For Hiragana/Katakana, SMALL is part of the letter identity, not case
-    if script_suffix in {"-hira", "-kata"}:
-        case_indicators_to_remove.discard("SMALL")
-    parts = [p for p in parts if p not in case_indicators_to_remove]
+        # For small capitals, keep both SMALL and CAPITAL for disambiguation
+        case_indicators_to_remove = frozenset()
+    elif is_small_variant or is_small_script_variant or script_suffix in _KANA_SCRIPTS:
+        # For Hiragana/Katakana, SMALL is part of the letter identity, not case
+        case_indicators_to_remove = _CAPITAL_INDICATOR
+    else:
+        case_indicators_to_remove = CASE_INDICATORS
+
+    # Remove script name words (all occurrences), category words (but keep
+    # some for disambiguation), case indicators, SYLLABICS and Hangul
+    # position words in a single pass
+    words_to_remove = (
+        (DROP_CATEGORIES - parts_to_keep)
+        | case_indicators_to_remove
+        | extra_words_to_remove
+    )
+    parts = [p for p in parts if p not in words_to_remove]
 
     # Remove "WITH" and similar connecting words (but keep FOR in SYMBOL FOR)
     # Don't remove TO/THE/OF when they're the main content (e.g., syllable names)
     # Only remove them if there are other content words left
-    connecting_words_tentative = {"WITH", "OF"}
-    if not is_symbol_for:
-        connecting_words_tentative.add("FOR")
-    # Don't remove TO/THE for syllables - they're the syllable value
-    if not has_syllable:
-        connecting_words_tentative.update({"TO", "THE"})
-    # Count how many non-connecting content words we have
+    connecting_words_tentative = _CONNECTING_WORDS[is_symbol_for, has_syllable]
     content_words = [p for p in parts if p not in connecting_words_tentative]
-    if len(content_words) > 0:
+    if content_words:
         # We have other content, safe to remove connecting words
-        parts = [p for p in parts if p not in connecting_words_tentative]
+        parts = content_words
     # Otherwise keep TO/THE/OF as they're the actual content
     # Keep AND/OR for logical operators - they're essential
 
     # Handle special multi-part name formats AFTER filtering
-    # For Runic: handle hyphenated compounds and multi-part names
-    if script_suffix == "-run":
-        # Split hyphenated parts like "LONG-BRANCH-OSS" or "DOTTED-N"
-        expanded_parts = []
-        for part in parts:
-            if "-" in part:
-                # Split hyphenated parts
-                expanded_parts.extend(part.split("-"))
-            else:
-                expanded_parts.append(part)
-        parts = expanded_parts
-
-        # For runic letters, filter single-letter transcription variants
-        # "FEHU FEOH FE F" -> keep "FEHU", "FEOH", "FE", drop "F"
-        # "OS O" -> keep "OS", drop "O"
-        # "DOTTED-N" -> keep "DOTTED", "N" (both meaningful, not variants)
-        # "V" -> keep "V" (only one part)
-
-        # If we have 2+ parts and at least one is multi-letter (2+ chars),
-        # check if they look like transcription variants
-        if len(parts) >= 2:
-            multi_letter_parts = [p for p in parts if len(p) > 1]
-            single_letter_parts = [p for p in parts if len(p) == 1]
-
-            # If ALL multi-letter parts look like transcriptions
-            # (not descriptors like DOTTED, LONG, BRANCH)
-            # then drop single letters
-            descriptors = {"DOTTED", "LONG", "BRANCH", "SHORT", "GOLDEN"}
-            non_descriptor_multi = [
-                p for p in multi_letter_parts if p not in descriptors
-            ]
-
-            if non_descriptor_multi and single_letter_parts:
-                # We have transcription variants, keep multi-letter only
-                parts = multi_letter_parts
-        # Otherwise keep all parts
+    # (Runic compounds, Hebrew accent/punctuation marks)
+    handler_suffix = ""
+    script_handler = _SCRIPT_HANDLERS.get(script_suffix)
+    if script_handler is not None:
+        parts, handler_suffix = script_handler(parts)
 
     # Special handling for Latin combining marks
     # For Latin script: "COMBINING GRAVE ACCENT" -> "graveCombining"
     # (move "COMBINING" to the end, before script suffix)
     is_combining = False
-    if "COMBINING" in name and not script_suffix:
+    if "COMBINING" in name_words and not script_suffix:
         # No script detected means it's a Latin/generic combining mark
         is_combining = True
         # Remove COMBINING from parts - it will be appended later
@@ -574,27 +850,15 @@ def glyph_data_for_unicode(decimal_unicode):
     # "MODIFIER LETTER SMALL H" -> "smallHModifier"
     # (move "MODIFIER" to the end, before script suffix)
     is_modifier = False
-    if "MODIFIER" in name and not script_suffix:
+    if "MODIFIER" in name_words and not script_suffix:
         # No script detected means it's a generic modifier letter
         is_modifier = True
         # Remove MODIFIER from parts - it will be appended later
         parts = [p for p in parts if p != "MODIFIER"]
 
-    # Special handling for Hebrew accent and punctuation marks
-    # "HEBREW ACCENT GERESH" -> "gereshAccent-heb"
-    # "HEBREW PUNCTUATION GERESH" -> "gereshPunctuation-heb"
-    hebrew_suffix = ""
-    if script_suffix == "-heb":
-        if "ACCENT" in parts:
-            hebrew_suffix = "Accent"
-            parts = [p for p in parts if p != "ACCENT"]
-        elif "PUNCTUATION" in parts:
-            hebrew_suffix = "Punctuation"
-            parts = [p for p in parts if p != "PUNCTUATION"]
-
     if not parts:
         # If nothing left, use fallback
-        return f"uni{decimal_unicode:04X}"
+        return _fallback_name(decimal_unicode)
 
     # Convert to camelCase with proper casing
     # For capital letters: First letter uppercase, rest lowercase (title case)
@@ -608,60 +872,62 @@ def glyph_data_for_unicode(decimal_unicode):
     # Check if first part is a multi-letter acronym/ligature
     # These are ligatures composed of single letters (AE, OE, IJ)
     # Criteria: 2-3 letters, all uppercase, is a capital letter, all alphabetic
+    # (cheapest checks first, so most names stop before any string scan)
     is_multi_letter_ligature = (
-        len(first_part) in (2, 3)  # 2-3 letters only
-        and first_part.isupper()  # All uppercase
-        and is_capital  # Is a capital letter
-        and all(c.isalpha() for c in first_part)  # Only letters
+        is_capital  # Is a capital letter
         and script_suffix == "-lat"  # Only for Latin script
+        and len(first_part) in (2, 3)  # 2-3 letters only
+        and first_part.isupper()  # All uppercase
+        and first_part.isalpha()  # Only letters
     )
 
     if is_multi_letter_ligature:
         # Keep as uppercase for ligatures (e.g., AE, OE, IJ)
-        glyph_name = first_part
+        first_glyph = first_part
     elif is_capital or is_caseless_letter:
         # Capital or caseless letter: title case (first upper, rest lower)
         # Applies to all scripts: Latin, Cyrillic, Armenian, Georgian, etc.
         # Caseless letters are treated as uppercase
-        glyph_name = first_part.capitalize()
+        first_glyph = _cap(first_part)
     else:
         # Small letter: all lowercase
-        glyph_name = first_part.lower()
+        first_glyph = _low(first_part)
 
     # Add remaining parts in title case
-    for part in parts[1:]:
-        glyph_name += part.capitalize()
+    # (fragments are collected in a list and joined once at the end)
+    pieces = [first_glyph]
+    pieces.extend(map(_cap, parts[1:]))
 
     # For Latin combining marks, append "Combining" at the end
     # (before script suffix)
     if is_combining:
-        glyph_name += "Combining"
+        pieces.append("Combining")
 
     # For modifier letters, append "Modifier" at the end
     # (before script suffix)
     if is_modifier:
-        glyph_name += "Modifier"
+        pieces.append("Modifier")
 
-    # For Hebrew, append accent/punctuation type at the end
-    # (before script suffix)
-    if hebrew_suffix:
-        glyph_name += hebrew_suffix
+    # For script handlers (e.g. Hebrew accent/punctuation), append their
+    # suffix at the end (before script suffix)
+    if handler_suffix:
+        pieces.append(handler_suffix)
 
     # For syllables, append syllable/syllabics type at the end
     # (before script suffix)
     if syllable_suffix:
-        glyph_name += syllable_suffix
+        pieces.append(syllable_suffix)
 
     # For caseless letters, append "Caseless" to disambiguate from capitals
     # (before script suffix)
     if caseless_suffix:
-        glyph_name += caseless_suffix
+        pieces.append(caseless_suffix)
 
     # For Hangul, append position indicator (before script suffix)
     if hangul_position:
-        glyph_name += hangul_position
+        pieces.append(hangul_position)
 
     # Add script suffix
-    glyph_name += script_suffix
+    pieces.append(script_suffix)
 
-    return glyph_name
+    return "".join(pieces)
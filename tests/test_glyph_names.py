@@ -1,13 +1,27 @@
 """Unit tests for glyph name generation."""
 
+import json
+import tempfile
 import unittest
-import youseedee
-from context_glyphdata import glyph_data_for_unicode
+from pathlib import Path
+from unittest import mock
+from context_glyphdata import (
+    glyph_data_for_unicode,
+    glyph_data_for_unicodes,
+    glyph_names_for_all,
+    named_characters,
+)
+from context_glyphdata.core import (
+    _CODED_NAME_PREFIXES,
+    _NAMES_CACHE_FILE,
+    _glyph_from_name,
+    _unicode_names,
+)
 
 
 # Test data: (codepoint, expected_result, unicode_name)
 # Organized by script categories matching SCRIPT_SUFFIXES
-TEST_CASES = [
+TEST_CASES = (
     #
     # Major world scripts - Latin
     (0x0041, "A-lat", "LATIN CAPITAL LETTER A"),
@@ -476,38 +490,218 @@ TEST_CASES = [
     # Non-script SIGN preservation (COLON vs COLON SIGN, etc.)
     (0x003A, "colon", "COLON"),
     (0x20A1, "colonSign", "COLON SIGN"),
-]
+    #
+    # Coded character families (fixed prefix plus a code)
+    (0xF900, "cjkCompatibilityIdeograph-f900", "CJK COMPATIBILITY IDEOGRAPH-F900"),
+    (0x2F800, "cjkCompatibilityIdeograph2f800", "CJK COMPATIBILITY IDEOGRAPH-2F800"),
+    (0x1B170, "nushu1b170", "NUSHU CHARACTER-1B170"),
+    (0x18800, "component001-tang", "TANGUT COMPONENT-001"),
+    (0x13000, "hieroglyphA001-egy", "EGYPTIAN HIEROGLYPH A001"),
+    (0x13460, "hieroglyph13460-egy", "EGYPTIAN HIEROGLYPH-13460"),
+)
+
+# All tested codepoints, in table order
+CODEPOINTS = tuple(codepoint for codepoint, _, _ in TEST_CASES)
+
+
+def _expected_glyph_names(test_cases):
+    """Map each codepoint to its expected glyph name, rejecting conflicts."""
+    # A few codepoints appear in more than one group above; a repeated row
+    # with a different result or name would otherwise silently replace the
+    # first one
+    rows = {}
+    for row in test_cases:
+        first = rows.setdefault(row[0], row)
+        if first != row:
+            raise ValueError(
+                f"Conflicting TEST_CASES rows for U+{row[0]:04X}: {first} and {row}"
+            )
+    return {codepoint: result for codepoint, result, _ in rows.values()}
+
+
+# Expected glyph name per codepoint, for lookups by codepoint
+EXPECTED_GLYPH_NAMES = _expected_glyph_names(TEST_CASES)
 
 
 class TestGlyphNameGeneration(unittest.TestCase):
     """Test cases for glyph name transformation."""
 
-    def test_all_glyph_names(self):
-        """Test all glyph name transformations with data validation."""
-        for codepoint, expected_result, expected_name in TEST_CASES:
-            with self.subTest(codepoint=f"U+{codepoint:04X}"):
-                # Verify the Unicode name matches our test data
-                ucd = youseedee.ucd_data(codepoint)
-                self.assertIsNotNone(ucd, f"No UCD data for U+{codepoint:04X}")
-                self.assertIn("Name", ucd, f"No name in UCD for U+{codepoint:04X}")
+    @classmethod
+    def setUpClass(cls):
+        # Only the character names are validated, so use the cached
+        # UnicodeData name table instead of querying the full UCD per row
+        cls.unicode_names = _unicode_names()
+        # Generate all glyph names up front, so the tests only compare
+        cls.glyph_names = glyph_data_for_unicodes(CODEPOINTS)
 
-                actual_name = ucd["Name"]
-                self.assertEqual(
-                    actual_name,
-                    expected_name,
-                    f"Unicode name mismatch for U+{codepoint:04X}: "
-                    f"expected '{expected_name}', got '{actual_name}'",
-                )
+    def check_test_case(self, codepoint, expected_result, expected_name):
+        """Check one TEST_CASES row, including its Unicode name."""
+        # Verify the Unicode name matches our test data
+        # (a codepoint missing from the UCD shows up as a None name)
+        actual_name = self.unicode_names.get(codepoint)
+        self.assertEqual(
+            actual_name,
+            expected_name,
+            f"Unicode name mismatch for U+{codepoint:04X}: "
+            f"expected '{expected_name}', got '{actual_name}'",
+        )
+
+        # Test the glyph name generation
+        result = self.glyph_names[codepoint]
+        self.assertEqual(
+            result,
+            expected_result,
+            f"U+{codepoint:04X} {expected_name}: "
+            f"expected '{expected_result}', got '{result}'",
+        )
+
+    def test_results_are_cached(self):
+        """Repeated lookups of the same codepoint are served from the cache."""
+        glyph_data_for_unicode.cache_clear()
+        first = glyph_data_for_unicode(0x0627)
+        second = glyph_data_for_unicode(0x0627)
+        self.assertEqual(first, second)
+        self.assertEqual(glyph_data_for_unicode.cache_info().hits, 1)
+
+    def test_named_characters(self):
+        """named_characters lists real names only, in codepoint order."""
+        characters = named_characters()
+        codepoints = [codepoint for codepoint, _ in characters]
+        self.assertEqual(codepoints, sorted(codepoints))
+        self.assertIn((0x0627, "ARABIC LETTER ALEF"), characters)
+        self.assertFalse(any(name.startswith("<") for _, name in characters))
 
-                # Test the glyph name generation
-                result = glyph_data_for_unicode(codepoint)
+    def test_coded_name_prefixes(self):
+        """The coded-name shortcut gives the same names as the full pipeline."""
+        names = [
+            (0x1B170, f"{prefix}-{code}")
+            for prefix in _CODED_NAME_PREFIXES
+            for code in ("001", "1B170", "F900")
+        ]
+        names += [
+            (codepoint, name)
+            for codepoint, name in named_characters()
+            if name.rpartition("-")[0] in _CODED_NAME_PREFIXES
+        ]
+        shortcut = [_glyph_from_name(codepoint, name) for codepoint, name in names]
+        with mock.patch.dict(_CODED_NAME_PREFIXES, clear=True):
+            pipeline = [_glyph_from_name(codepoint, name) for codepoint, name in names]
+        self.assertEqual(shortcut, pipeline)
+
+    def test_unnamed_ranges(self):
+        """Ideographs and Hangul syllables inside their ranges use uniXXXX."""
+        for codepoint in (0x4E01, 0x9FFE, 0xAC01, 0xD7A2, 0x17001, 0x20001):
+            with self.subTest(codepoint=f"U+{codepoint:04X}"):
                 self.assertEqual(
-                    result,
-                    expected_result,
-                    f"U+{codepoint:04X} {expected_name}: "
-                    f"expected '{expected_result}', got '{result}'",
+                    glyph_data_for_unicode(codepoint), f"uni{codepoint:04X}"
                 )
 
+    def test_glyph_names_for_all(self):
+        """The batch API produces the same names as single lookups."""
+        all_glyph_names = glyph_names_for_all()
+        mismatches = [
+            f"U+{codepoint:04X}: expected '{expected_result}', "
+            f"got '{all_glyph_names.get(codepoint)}'"
+            for codepoint, expected_result in EXPECTED_GLYPH_NAMES.items()
+            if all_glyph_names.get(codepoint) != expected_result
+        ]
+        self.assertFalse(mismatches, "\n" + "\n".join(mismatches))
+
+    def test_glyph_data_for_unicodes(self):
+        """The batch lookup names each distinct codepoint once, in order."""
+        self.assertEqual(
+            glyph_data_for_unicodes([0x0628, 0x0627, 0x0627]),
+            {
+                0x0627: EXPECTED_GLYPH_NAMES[0x0627],
+                0x0628: EXPECTED_GLYPH_NAMES[0x0628],
+            },
+        )
+
+        # A whole table with every codepoint repeated, in reverse order
+        codepoints = list(reversed(CODEPOINTS)) * 2
+        glyph_names = glyph_data_for_unicodes(codepoints)
+        self.assertEqual(list(glyph_names), sorted(EXPECTED_GLYPH_NAMES))
+        self.assertEqual(glyph_names, EXPECTED_GLYPH_NAMES)
+
+
+class TestUnicodeNamesCache(unittest.TestCase):
+    """Test the on-disk cache of the UnicodeData name table."""
+
+    def setUp(self):
+        # Point the cache at an empty directory, so each test starts cold
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch(
+            "context_glyphdata.core._cache_dir", return_value=Path(directory.name)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = Path(directory.name) / _NAMES_CACHE_FILE
+        self.addCleanup(_unicode_names.cache_clear)
+
+    def load_names(self):
+        """Load the name table as a new process would."""
+        _unicode_names.cache_clear()
+        return _unicode_names()
+
+    def test_reload_matches_cold_build(self):
+        """A table reloaded from the cache equals the one built from the UCD."""
+        built = self.load_names()
+        self.assertTrue(self.cache.is_file())
+        self.assertEqual(built[0x0627], "ARABIC LETTER ALEF")
+
+        # The reload must come from the cache file, not from the UCD
+        with mock.patch("youseedee.parsed_unicode_file", side_effect=AssertionError):
+            self.assertEqual(self.load_names(), built)
+        self.assertEqual(list(self.cache.parent.glob("*.tmp")), [])
+
+    def test_stale_cache_is_rebuilt(self):
+        """A cache built from another UnicodeData.txt is replaced."""
+        built = self.load_names()
+        self.cache.write_text(
+            json.dumps({"source": [0, 0], "names": [[0x0627, "STALE"]]}),
+            encoding="utf-8",
+        )
+        self.assertEqual(self.load_names(), built)
+        with open(self.cache, encoding="utf-8") as f:
+            self.assertNotEqual(json.load(f)["source"], [0, 0])
+
+    def test_corrupt_cache_is_rebuilt(self):
+        """An unreadable cache is replaced instead of raising."""
+        built = self.load_names()
+        self.cache.write_text('{"source": [', encoding="utf-8")
+        self.assertEqual(self.load_names(), built)
+        with mock.patch("youseedee.parsed_unicode_file", side_effect=AssertionError):
+            self.assertEqual(self.load_names(), built)
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        """If the cache can't be written, the table is still returned."""
+        with mock.patch("os.replace", side_effect=OSError):
+            names = self.load_names()
+        self.assertEqual(names[0x0627], "ARABIC LETTER ALEF")
+        self.assertFalse(self.cache.exists())
+        self.assertEqual(list(self.cache.parent.glob("*.tmp")), [])
+
+
+def _make_test_case(codepoint, expected_result, expected_name):
+    def test(self):
+        self.check_test_case(codepoint, expected_result, expected_name)
+
+    test.__doc__ = f"U+{codepoint:04X} {expected_name} -> {expected_result}"
+    return test
+
+
+# One test method per TEST_CASES row (e.g. test_glyph_name_007_0627), so test
+# runners report, select and distribute the rows individually. The row index
+# keeps rows that repeat a codepoint from replacing each other's test.
+for _index, (_codepoint, _expected_result, _expected_name) in enumerate(TEST_CASES):
+    setattr(
+        TestGlyphNameGeneration,
+        f"test_glyph_name_{_index:03d}_{_codepoint:04X}",
+        _make_test_case(_codepoint, _expected_result, _expected_name),
+    )
+del _index, _codepoint, _expected_result, _expected_name
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,16 +22,140 @@ after Unicode version updates:
 These tests help ensure comprehensive script coverage as Unicode evolves.
 """
 
+import itertools
+import re
 import unittest
-from collections import Counter, defaultdict
-import youseedee
-from context_glyphdata.core import SCRIPT_SUFFIXES, DROP_CATEGORIES
-from context_glyphdata import glyph_data_for_unicode
+from collections import Counter
+from context_glyphdata.core import SCRIPT_SUFFIXES, DROP_CATEGORIES, _unicode_names
+from context_glyphdata import glyph_names_for_all, named_characters
+
+
+# Words that are not script names; candidates containing any of them are
+# filtered out of the missing-scripts report
+KNOWN_EXCEPTIONS = frozenset(
+    {
+        "VERTICAL",
+        "HORIZONTAL",
+        "COMBINING",
+        "SPACING",
+        "MODIFIER",
+        "DOUBLE",
+        "TRIPLE",
+        "SINGLE",
+        "FINAL",
+        "INITIAL",
+        "MEDIAL",
+        "ISOLATED",
+        "PRESENTATION",
+        "COMPATIBILITY",
+        "FULLWIDTH",
+        "HALFWIDTH",
+        "SMALL",
+        "CAPITAL",
+        "SQUARED",
+        "CIRCLED",
+        "PARENTHESIZED",
+        "MATHEMATICAL",
+        "SANS-SERIF",
+        "BOLD",
+        "ITALIC",
+        "SCRIPT",
+        "FRAKTUR",
+        "MONOSPACE",
+        "BLACK",
+        "WHITE",
+        "HEAVY",
+        "LIGHT",
+        "DASHED",
+        "DOTTED",
+        "VOWEL",
+        "BRAILLE",
+        "KANGXI",
+        "WITH",
+        "DOT",
+        "SYLLABICS",
+        "PSILI",
+        "NUMERIC",
+        "ARROW",
+        "BOX",
+        "CJK",
+        "DRAWINGS",
+        "CARRIER",
+        "PATTERN",
+        "ABOVE",
+        "BELOW",
+    }
+)
+# One alternation finds any of the exceptions inside a candidate
+KNOWN_EXCEPTIONS_RE = re.compile("|".join(map(re.escape, sorted(KNOWN_EXCEPTIONS))))
+
+
+def ucd_name(codepoint):
+    """Return the UnicodeData name of a codepoint, or None if it has none."""
+    # The name table is kept in the package's disk cache, so later runs
+    # load it instead of parsing UnicodeData.txt again
+    return _unicode_names().get(codepoint)
+
+
+# Sample ranges to check (covers most named characters)
+SAMPLE_RANGES = (
+    (0x0000, 0x0FFF),  # Basic Multilingual Plane start
+    (0x1000, 0x1FFF),  # Extended scripts
+    (0x2000, 0x2FFF),  # Symbols and additional scripts
+    (0x3000, 0x9FFF),  # CJK and additional scripts
+    (0xA000, 0xAFFF),  # Yi and other scripts
+    (0x10000, 0x10FFF),  # Linear B, Aegean, Old Italic, etc.
+    (0x11000, 0x11FFF),  # Brahmi, Kaithi, etc.
+    (0x12000, 0x12FFF),  # Cuneiform
+    (0x13000, 0x13FFF),  # Egyptian Hieroglyphs
+    (0x16000, 0x16FFF),  # Runic, Ogham, etc.
+)
+
+
+def sampled_names(step):
+    """Return the names of every step-th codepoint in SAMPLE_RANGES."""
+    # All ranges are flattened into one sequence of codepoints, and
+    # unnamed codepoints and range markers are dropped up front
+    codepoints = itertools.chain.from_iterable(
+        range(start, end, step) for start, end in SAMPLE_RANGES
+    )
+    names = map(ucd_name, codepoints)
+    return [name for name in names if name and not name.startswith("<")]
+
+
+def script_candidates(name):
+    """Yield the words, or word pairs, of a name that may be script names."""
+    parts = name.split()
+
+    # Script names typically appear before category words, so each word is
+    # paired with the one after it (the last word has none)
+    for part, next_part in zip(parts, parts[1:]):
+        # Skip if it's a category word
+        if part in DROP_CATEGORIES:
+            continue
+
+        # Check if this could be a script name
+        # Script names are typically ALL CAPS words before the category
+        if part.isupper() and len(part) > 2:
+            # Check if it's followed by a category word
+            # or if it's in a known position for script names
+            if next_part in DROP_CATEGORIES:
+                yield part
+            # Multi-word scripts
+            elif next_part.isupper() and len(next_part) > 2:
+                yield f"{part} {next_part}"
 
 
 class TestScriptCoverage(unittest.TestCase):
     """Test that SCRIPT_SUFFIXES covers all commonly used scripts."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Look up names and generate glyph names once for all tests
+        cls.characters = named_characters()
+        cls.glyph_names = glyph_names_for_all()
+        cls.sampled_names = {step: sampled_names(step) for step in (8, 16)}
+
     def test_no_duplicate_script_suffixes(self):
         """
         Verify that no two scripts share the same suffix.
@@ -70,49 +194,43 @@ class TestScriptCoverage(unittest.TestCase):
 
         Also checks that no glyph names contain underscores.
         """
-        glyph_name_to_codepoints = defaultdict(list)
+        # First character seen per glyph name; a list of characters is only
+        # started for a glyph name once a second one turns up. The report
+        # shows 5 characters per duplicate, so only those are kept, and
+        # occurrences are counted separately.
+        first_seen = {}
+        duplicates = {}
+        occurrences = {}
         glyph_names_with_underscores = []
         total_chars = 0
 
-        # Scan entire Unicode range (0x0000 to 0x10FFFF)
+        # Scan entire Unicode catalog (0x0000 to 0x10FFFF)
         # We'll check every codepoint that has a name
         print("\nScanning Unicode catalog for duplicate glyph names...")
 
-        for codepoint in range(0x0000, 0x110000):
-            try:
-                ucd = youseedee.ucd_data(codepoint)
-                if not ucd or "Name" not in ucd:
-                    continue
-
-                name = ucd["Name"]
-                if not name or name.startswith("<"):
-                    continue
-
-                # Generate glyph name
-                glyph_name = glyph_data_for_unicode(codepoint)
-                if glyph_name:
-                    glyph_name_to_codepoints[glyph_name].append((codepoint, name))
-                    total_chars += 1
-
-                    # Check for underscores
-                    if "_" in glyph_name:
-                        glyph_names_with_underscores.append(
-                            (codepoint, name, glyph_name)
-                        )
-
-            except Exception:
-                # Skip characters that cause errors
-                continue
-
-        # Find duplicates
-        duplicates = {
-            glyph_name: codepoints
-            for glyph_name, codepoints in glyph_name_to_codepoints.items()
-            if len(codepoints) > 1
-        }
+        for codepoint, name in self.characters:
+            glyph_name = self.glyph_names[codepoint]
+            if glyph_name:
+                previous = first_seen.setdefault(glyph_name, (codepoint, name))
+                if previous[0] != codepoint:
+                    shown = duplicates.setdefault(glyph_name, [previous])
+                    if len(shown) < 5:
+                        shown.append((codepoint, name))
+                    # The first character is counted with the first collision
+                    occurrences[glyph_name] = occurrences.get(glyph_name, 1) + 1
+                total_chars += 1
 
         print(f"Scanned {total_chars} named characters")
 
+        # Check for underscores in one search over all glyph names, and only
+        # collect the offending characters if there are any
+        if "_" in "\0".join(first_seen):
+            glyph_names_with_underscores = [
+                (codepoint, name, self.glyph_names[codepoint])
+                for codepoint, name in self.characters
+                if "_" in (self.glyph_names[codepoint] or "")
+            ]
+
         # Check for underscores first
         if glyph_names_with_underscores:
             msg_lines = [
@@ -144,20 +262,21 @@ class TestScriptCoverage(unittest.TestCase):
                 "",
             ]
 
-            # Sort by number of duplicates (most problematic first)
+            # Sort by number of duplicates (most problematic first), then by
+            # first codepoint, as duplicates were found in collision order
             sorted_duplicates = sorted(
                 duplicates.items(),
-                key=lambda x: len(x[1]),
-                reverse=True,
+                key=lambda x: (-occurrences[x[0]], x[1][0][0]),
             )
 
             # Show first 20 most problematic duplicates
             for glyph_name, codepoints in sorted_duplicates[:20]:
-                msg_lines.append(f"  '{glyph_name}' ({len(codepoints)} occurrences):")
-                for cp, unicode_name in codepoints[:5]:  # Show first 5
+                count = occurrences[glyph_name]
+                msg_lines.append(f"  '{glyph_name}' ({count} occurrences):")
+                for cp, unicode_name in codepoints:
                     msg_lines.append(f"    U+{cp:04X} {unicode_name}")
-                if len(codepoints) > 5:
-                    msg_lines.append(f"    ... and {len(codepoints) - 5} more")
+                if count > 5:
+                    msg_lines.append(f"    ... and {count - 5} more")
                 msg_lines.append("")
 
             if len(duplicates) > 20:
@@ -184,65 +303,13 @@ class TestScriptCoverage(unittest.TestCase):
         It allows for some scripts to be missing (very rare or specialized
         scripts), but alerts if commonly used scripts are missing.
         """
-        # Sample ranges to check (covers most named characters)
-        sample_ranges = [
-            (0x0000, 0x0FFF),  # Basic Multilingual Plane start
-            (0x1000, 0x1FFF),  # Extended scripts
-            (0x2000, 0x2FFF),  # Symbols and additional scripts
-            (0x3000, 0x9FFF),  # CJK and additional scripts
-            (0xA000, 0xAFFF),  # Yi and other scripts
-            (0x10000, 0x10FFF),  # Linear B, Aegean, Old Italic, etc.
-            (0x11000, 0x11FFF),  # Brahmi, Kaithi, etc.
-            (0x12000, 0x12FFF),  # Cuneiform
-            (0x13000, 0x13FFF),  # Egyptian Hieroglyphs
-            (0x16000, 0x16FFF),  # Runic, Ogham, etc.
-        ]
-
         # Extract script names from character names
+        # (sample every 16th character to keep test fast)
+        names = self.sampled_names[16]
+        total_chars_checked = len(names)
         script_counter = Counter()
-        total_chars_checked = 0
-
-        for start, end in sample_ranges:
-            # Sample every 16th character to keep test fast
-            for codepoint in range(start, end, 16):
-                try:
-                    ucd = youseedee.ucd_data(codepoint)
-                    if not ucd or "Name" not in ucd:
-                        continue
-
-                    name = ucd["Name"]
-                    if not name or name.startswith("<"):
-                        continue
-
-                    total_chars_checked += 1
-                    parts = name.split()
-
-                    # Look for potential script names
-                    # Script names typically appear before category words
-                    for i, part in enumerate(parts):
-                        # Skip if it's a category word
-                        if part in DROP_CATEGORIES:
-                            continue
-
-                        # Check if this could be a script name
-                        # Script names are typically ALL CAPS words before
-                        # the category
-                        if part.isupper() and len(part) > 2:
-                            # Check if it's followed by a category word
-                            # or if it's in a known position for script names
-                            if i + 1 < len(parts) and parts[i + 1] in DROP_CATEGORIES:
-                                script_counter[part] += 1
-                            # Multi-word scripts
-                            elif (
-                                i + 1 < len(parts)
-                                and parts[i + 1].isupper()
-                                and len(parts[i + 1]) > 2
-                            ):
-                                multi_word = f"{part} {parts[i + 1]}"
-                                script_counter[multi_word] += 1
-                except Exception:
-                    # Skip characters that cause errors
-                    continue
+        for name in names:
+            script_counter.update(script_candidates(name))
 
         # Now check which scripts appear frequently but aren't in
         # SCRIPT_SUFFIXES
@@ -272,63 +339,10 @@ class TestScriptCoverage(unittest.TestCase):
                 missing_scripts[script] = count
 
         # Filter out known exceptions (these are not script names)
-        known_exceptions = {
-            "VERTICAL",
-            "HORIZONTAL",
-            "COMBINING",
-            "SPACING",
-            "MODIFIER",
-            "DOUBLE",
-            "TRIPLE",
-            "SINGLE",
-            "FINAL",
-            "INITIAL",
-            "MEDIAL",
-            "ISOLATED",
-            "PRESENTATION",
-            "COMPATIBILITY",
-            "FULLWIDTH",
-            "HALFWIDTH",
-            "SMALL",
-            "CAPITAL",
-            "SQUARED",
-            "CIRCLED",
-            "PARENTHESIZED",
-            "MATHEMATICAL",
-            "SANS-SERIF",
-            "BOLD",
-            "ITALIC",
-            "SCRIPT",
-            "FRAKTUR",
-            "MONOSPACE",
-            "BLACK",
-            "WHITE",
-            "HEAVY",
-            "LIGHT",
-            "DASHED",
-            "DOTTED",
-            "VOWEL",
-            "BRAILLE",
-            "KANGXI",
-            "WITH",
-            "DOT",
-            "SYLLABICS",
-            "PSILI",
-            "NUMERIC",
-            "ARROW",
-            "BOX",
-            "CJK",
-            "DRAWINGS",
-            "CARRIER",
-            "PATTERN",
-            "ABOVE",
-            "BELOW",
-        }
-
         missing_scripts = {
             script: count
             for script, count in missing_scripts.items()
-            if not any(exc in script for exc in known_exceptions)
+            if not KNOWN_EXCEPTIONS_RE.search(script)
         }
 
         # Generate informative message
@@ -376,45 +390,18 @@ class TestScriptCoverage(unittest.TestCase):
 
         This catches typos or obsolete script names in SCRIPT_SUFFIXES.
         """
-        # Sample ranges (same as above)
-        sample_ranges = [
-            (0x0000, 0x0FFF),
-            (0x1000, 0x1FFF),
-            (0x2000, 0x2FFF),
-            (0x3000, 0x9FFF),
-            (0xA000, 0xAFFF),
-            (0x10000, 0x10FFF),
-            (0x11000, 0x11FFF),
-            (0x12000, 0x12FFF),
-            (0x13000, 0x13FFF),
-            (0x16000, 0x16FFF),
-        ]
-
         # Find which defined scripts appear in character names
-        found_scripts = set()
-
-        for start, end in sample_ranges:
-            for codepoint in range(start, end, 8):  # Sample every 8th
-                try:
-                    ucd = youseedee.ucd_data(codepoint)
-                    if not ucd or "Name" not in ucd:
-                        continue
-
-                    name = ucd["Name"]
-                    if not name or name.startswith("<"):
-                        continue
-
-                    # Check which defined scripts appear in this name
-                    for script in SCRIPT_SUFFIXES.keys():
-                        if script in name:
-                            found_scripts.add(script)
-
-                except Exception:
-                    continue
-
-        # Find scripts that are defined but never found
-        unused_scripts = set(SCRIPT_SUFFIXES.keys()) - found_scripts
+        # (a script only needs to be found once, so scripts that have been
+        # found are no longer searched for in later names)
+        unused_scripts = set(SCRIPT_SUFFIXES.keys())
+
+        for name in self.sampled_names[8]:  # Sample every 8th
+            # Check which remaining scripts appear in this name
+            unused_scripts.difference_update(
+                [script for script in unused_scripts if script in name]
+            )
 
+        # What is left are the scripts that are defined but never found
         # Some scripts are prefix/generic patterns and won't be found directly
         # These are OK to not find in actual character names
         allowed_unused = {